@@ -18,9 +18,11 @@
 """
 Product Store Service with UI
 """
+import json
 from flask import jsonify, request, abort
 from flask import url_for  # noqa: F401 pylint: disable=unused-import
-from service.models import Product, Category
+from sqlalchemy import text
+from service.models import Product, Category, db
 from service.common import status  # HTTP Status Codes
 from . import app
 from urllib.parse import quote_plus
@@ -95,6 +97,50 @@ def create_products():
     return jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
 
 
+######################################################################
+# B U L K   C R E A T E   P R O D U C T S
+######################################################################
+@app.route("/products/bulk", methods=["POST"])
+def create_products_bulk():
+    """
+    Creates a batch of Products
+    This endpoint will create every Product in the JSON array that is posted
+    and return the list of ids that were assigned, in order
+    """
+    app.logger.info("Request to Create Products in bulk...")
+    check_content_type("application/json")
+
+    data = request.get_json()
+    if not isinstance(data, list):
+        abort(status.HTTP_400_BAD_REQUEST, "Expected a JSON array of products")
+
+    # validate the payload the same way the single product route would
+    products = [Product().deserialize(row) for row in data]
+
+    if db.session.get_bind().dialect.name == "postgresql":
+        # On Postgres one INSERT ... SELECT from json_populate_recordset
+        # inserts the whole batch and returns the new ids in a single
+        # round trip, which beats inserting the rows one at a time
+        result = db.session.execute(
+            text(
+                "INSERT INTO product (name, description, price, available, category) "
+                "SELECT name, description, price, available, category "
+                "FROM json_populate_recordset(null::product, :payload) "
+                "RETURNING id"
+            ),
+            {"payload": json.dumps(data)},
+        )
+        ids = [row.id for row in result]
+        db.session.commit()
+    else:
+        db.session.add_all(products)
+        db.session.commit()
+        ids = [product.id for product in products]
+
+    app.logger.info("[%s] Products saved in bulk!", len(ids))
+    return jsonify(ids), status.HTTP_201_CREATED
+
+
 ######################################################################
 # L I S T   A L L   P R O D U C T S
 ######################################################################
@@ -0,0 +1,47 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Precomputed fixture data for the test suite
+
+Faker pays locale loading and provider lookup costs for every attribute
+of every product it fabricates. Tests that only need "some products"
+can draw from PRODUCT_POOL, a pool of attribute dictionaries built once
+at import time, instead of invoking Faker again for each row. Keep
+using ProductFactory directly in tests that need fresh random data.
+"""
+import random
+
+from tests.factories import ProductFactory
+
+POOL_SIZE = 100
+
+
+def product_row(product) -> dict:
+    """Returns the column values of a product as a dict for bulk inserts"""
+    return {
+        "name": product.name,
+        "description": product.description,
+        "price": product.price,
+        "available": product.available,
+        "category": product.category,
+    }
+
+
+PRODUCT_POOL = [product_row(ProductFactory.build()) for _ in range(POOL_SIZE)]
+
+
+def random_rows(count: int) -> list:
+    """Returns count attribute dictionaries drawn from the pool"""
+    return [dict(random.choice(PRODUCT_POOL)) for _ in range(count)]